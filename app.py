@@ -16,6 +16,7 @@ from src.data.loader import DataLoader
 from src.core.performance import PerformanceAnalyzer
 from src.core.risk import RiskAnalyzer
 from src.core.simulation import MonteCarloSimulator
+from src.core.volatility import GarchModel
 
 st.set_page_config(page_title="Financial Analyst Mode", layout="wide", page_icon="📈")
 
@@ -42,8 +43,12 @@ st.markdown("### Financial Data Analyst Mode")
 # --- Sidebar ---
 st.sidebar.header("Configuration")
 ticker = st.sidebar.text_input("Ticker Symbol", value="AAPL").upper()
-period = st.sidebar.selectbox("Period", options=["1mo", "3mo", "6mo", "1y", "2y", "5y", "max"], index=3)
-interval = st.sidebar.selectbox("Interval", options=["1d", "1wk", "1mo"], index=0)
+period = st.sidebar.selectbox("Period", options=["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "max"], index=5)
+interval = st.sidebar.selectbox(
+    "Interval", options=DataLoader.INTERVALS, index=DataLoader.INTERVALS.index("1d"),
+    help="Yahoo Finance limits history for intraday bars: 1m up to 5d, 5m-30m up to 1mo, 1h up to 2y."
+)
+periods_per_year = PerformanceAnalyzer.get_periods_per_year(interval)
 
 if st.sidebar.button("Analyze"):
     with st.spinner(f"Fetching data for {ticker}..."):
@@ -53,15 +58,21 @@ if st.sidebar.button("Analyze"):
         
         if df.empty:
             st.error(f"Could not fetch data for {ticker}. Please check the symbol.")
+        elif len(df) < 3:
+            st.error(f"Only {len(df)} {interval} bar(s) returned for {ticker}. Choose a longer period or a finer interval.")
         else:
             # Calculate Metrics
             daily_returns = PerformanceAnalyzer.calculate_daily_returns(df)
             
-            volatility = RiskAnalyzer.calculate_volatility(daily_returns)
+            volatility = RiskAnalyzer.calculate_volatility(daily_returns, periods_per_year=periods_per_year)
             max_dd = RiskAnalyzer.calculate_max_drawdown(df)
             var_95 = RiskAnalyzer.calculate_historical_var(daily_returns)
+            es_95 = RiskAnalyzer.calculate_historical_es(daily_returns)
+            intervals = RiskAnalyzer.bootstrap_confidence_intervals(
+                daily_returns, periods_per_year=periods_per_year
+            )
             
-            sharpe = PerformanceAnalyzer.calculate_sharpe_ratio(df)
+            sharpe = PerformanceAnalyzer.calculate_sharpe_ratio(df, periods_per_year=periods_per_year)
             cagr = PerformanceAnalyzer.calculate_cagr(df)
             
             current_price = df['Close'].iloc[-1]
@@ -114,7 +125,7 @@ if st.sidebar.button("Analyze"):
                 with col_risk1:
                     st.subheader("Return Distribution")
                     fig_hist = go.Figure(data=[go.Histogram(x=daily_returns, nbinsx=50, name="Returns")])
-                    fig_hist.update_layout(title_text="Daily Returns Distribution", template="plotly_dark")
+                    fig_hist.update_layout(title_text=f"{interval} Returns Distribution", template="plotly_dark")
                     st.plotly_chart(fig_hist, use_container_width=True)
                     
                 with col_risk2:
@@ -128,6 +139,23 @@ if st.sidebar.button("Analyze"):
                     fig_dd.add_trace(go.Scatter(x=df['Date'], y=drawdown, fill='tozeroy', name="Drawdown", line=dict(color='red')))
                     fig_dd.update_layout(title_text="Underwater Plot", template="plotly_dark")
                     st.plotly_chart(fig_dd, use_container_width=True)
+
+                st.subheader("Tail Risk & 95% Bootstrap Confidence Intervals")
+                st.metric("Expected Shortfall (95%)", f"{es_95:.2%}", delta_color="inverse")
+                if any(np.isnan(bound) for bounds in intervals.values() for bound in bounds):
+                    st.info("Not enough returns to bootstrap confidence intervals.")
+                else:
+                    ci_table = pd.DataFrame(
+                        [
+                            ("VaR (95%)", var_95, *intervals['var']),
+                            ("Expected Shortfall (95%)", es_95, *intervals['expected_shortfall']),
+                            ("Sharpe Ratio", sharpe, *intervals['sharpe_ratio']),
+                            ("Max Drawdown", max_dd, *intervals['max_drawdown']),
+                        ],
+                        columns=["Metric", "Estimate", "Lower", "Upper"]
+                    )
+                    st.dataframe(ci_table.style.format({"Estimate": "{:.4f}", "Lower": "{:.4f}", "Upper": "{:.4f}"}),
+                                 use_container_width=True, hide_index=True)
             
             with tab3:
                 st.subheader("Monte Carlo Simulation (Future Price Projection)")
@@ -137,22 +165,42 @@ if st.sidebar.button("Analyze"):
                 with col_sim1:
                     sim_days = st.slider("Days to Forecast", 30, 365, 252)
                     num_sims = st.slider("Number of Simulations", 100, 1000, 200)
+                    vol_model = st.radio("Volatility Model", ["Constant (GBM)", "GARCH(1,1)"])
                     
                     if st.button("Run Simulation"):
                         with st.spinner("Running Monte Carlo..."):
                             # Parameters
-                            mu = daily_returns.mean() * 252
+                            mu = daily_returns.mean() * periods_per_year
                             sigma = volatility
                             start_price = current_price
                             
                             # Run Sim
-                            paths = MonteCarloSimulator.simulate_future_prices(
-                                start_price, mu, sigma, sim_days, num_sims
-                            )
-                            stats = MonteCarloSimulator.get_simulation_stats(paths)
-                            
-                            st.session_state['sim_paths'] = paths
-                            st.session_state['sim_stats'] = stats
+                            paths = None
+                            if vol_model == "GARCH(1,1)":
+                                # The simulator steps in days, so GARCH is always fitted on daily bars
+                                daily_df = df if interval == "1d" else DataLoader.fetch_stock_data(ticker, period, "1d")
+                                try:
+                                    garch = GarchModel.fit(PerformanceAnalyzer.calculate_daily_returns(daily_df)).iloc[0]
+                                except ValueError as e:
+                                    garch = None
+                                    st.error(f"GARCH fit failed: {e}")
+                                if garch is not None and np.isnan(garch['omega']):
+                                    st.error("GARCH fit needs at least 10 daily returns with non-zero variance. Choose a longer period.")
+                                elif garch is not None:
+                                    paths = MonteCarloSimulator.simulate_garch_prices(
+                                        start_price, mu, garch['omega'], garch['alpha'], garch['beta'],
+                                        garch['gamma'], garch['last_variance'], garch['last_residual'],
+                                        sim_days, num_sims
+                                    )
+                            else:
+                                paths = MonteCarloSimulator.simulate_future_prices(
+                                    start_price, mu, sigma, sim_days, num_sims
+                                )
+
+                            if paths is not None:
+                                st.session_state['sim_paths'] = paths
+                                st.session_state['sim_stats'] = MonteCarloSimulator.get_simulation_stats(paths)
+                                st.session_state['sim_model'] = vol_model
                             
                 with col_sim2:
                     if 'sim_paths' in st.session_state:
@@ -172,7 +220,8 @@ if st.sidebar.button("Analyze"):
                         fig_sim.add_trace(go.Scatter(x=x_axis, y=mean_path, mode='lines', 
                                                      name="Mean Path", line=dict(color='yellow', width=2)))
                         
-                        fig_sim.update_layout(title="Projected Price Paths (Geometric Brownian Motion)", 
+                        model_name = "GARCH(1,1) Volatility" if st.session_state.get('sim_model') == "GARCH(1,1)" else "Geometric Brownian Motion"
+                        fig_sim.update_layout(title=f"Projected Price Paths ({model_name})", 
                                               xaxis_title="Days into Future", yaxis_title="Price", template="plotly_dark")
                         st.plotly_chart(fig_sim, use_container_width=True)
                         
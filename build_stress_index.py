@@ -0,0 +1,40 @@
+import sys
+import os
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.getcwd())
+
+from src.data.loader import DataLoader
+from src.core.stress import StressTester
+
+# Nightly job: builds the stress index read by the API's /stress endpoint.
+# Usage: python build_stress_index.py AAPL MSFT ... (or a file with one ticker per line via @tickers.txt)
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if len(args) == 1 and args[0].startswith("@"):
+        with open(args[0][1:]) as f:
+            args = [line.strip() for line in f if line.strip()]
+    if not args:
+        print("Usage: python build_stress_index.py TICKER [TICKER ...] | @tickers.txt")
+        sys.exit(1)
+
+    closes = {}
+    for ticker in args:
+        df = DataLoader.fetch_stock_data(ticker, period="max", interval="1d")
+        if df.empty:
+            print(f"Skipping {ticker}: no data")
+            continue
+        series = df.set_index('Date')['Close']
+        # Align on calendar dates so tickers from different exchanges share one index
+        series.index = pd.DatetimeIndex(series.index).tz_localize(None).normalize()
+        closes[ticker] = series
+
+    # Carry prices over other exchanges' trading days, but not before listing or after delisting
+    prices = pd.DataFrame(closes).sort_index()
+    prices = prices.ffill().where(prices.bfill().notna())
+    index = StressTester.build_index(prices)
+
+    path = os.getenv("STRESS_INDEX_PATH", "stress_index.pkl")
+    StressTester.save_index(index, path)
+    print(f"Stress index for {len(closes)} tickers written to {path}")
@@ -1,11 +1,15 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import pandas as pd
+import numpy as np
 
 from app.data.loader import DataLoader
 from app.core.performance import PerformanceAnalyzer
 from app.core.risk import RiskAnalyzer
+from app.core.stress import StressTester
 
 app = FastAPI(
     title="Financial Intelligence System API",
@@ -26,14 +30,56 @@ class AnalysisResponse(BaseModel):
     max_drawdown: float
     cagr: float
     value_at_risk_95: float
+    expected_shortfall_95: float
+    confidence_intervals_95: Optional[Dict[str, List[float]]] = None
     company_info: Dict
 
+# Nightly index over full ("max") history, written by build_stress_index.py
+STRESS_INDEX_PATH = os.getenv("STRESS_INDEX_PATH", "stress_index.pkl")
+_stress_index_cache: Dict[str, object] = {"mtime": None, "index": None}
+
+class StressRequest(BaseModel):
+    holdings: Dict[str, float]
+    period: str = "max"
+    rank: int = 1
+
+class StressResponse(BaseModel):
+    scenarios: Dict[str, Dict[str, float]]
+    worst_windows: Dict[str, Dict[str, float]]
+    missing_tickers: List[str]
+
+def get_persisted_stress_index() -> Optional[Dict[str, pd.DataFrame]]:
+    """Loads the persisted stress index, reloading it when the file is rebuilt."""
+    try:
+        mtime = os.path.getmtime(STRESS_INDEX_PATH)
+    except OSError:
+        return None
+    if _stress_index_cache["mtime"] != mtime:
+        _stress_index_cache["index"] = StressTester.load_index(STRESS_INDEX_PATH)
+        _stress_index_cache["mtime"] = mtime
+    return _stress_index_cache["index"]
+
+def get_stress_index(ticker: str, period: str) -> Optional[Dict[str, pd.DataFrame]]:
+    """Returns the stress index stored with the cached prices, building it on first use."""
+    index = DataLoader.get_artifact(ticker, period, "stress_index")
+    if index is None:
+        df = DataLoader.fetch_stock_data(ticker, period, "1d")
+        if df.empty:
+            return None
+        prices = df.set_index('Date')[['Close']].rename(columns={'Close': ticker})
+        index = StressTester.build_index(prices)
+        DataLoader.store_artifact(ticker, period, "stress_index", index)
+    return index
+
 @app.get("/")
 async def root():
     return {"message": "Financial Intelligence System API is running"}
 
 @app.post("/analyze", response_model=AnalysisResponse)
 async def analyze_stock(request: AnalysisRequest):
+    if request.interval not in PerformanceAnalyzer.PERIODS_PER_YEAR:
+        raise HTTPException(status_code=400, detail=f"Unsupported interval '{request.interval}'")
+
     try:
         # 1. Fetch Data
         df = DataLoader.fetch_stock_data(request.ticker, request.period, request.interval)
@@ -44,13 +90,23 @@ async def analyze_stock(request: AnalysisRequest):
         info = DataLoader.fetch_company_info(request.ticker)
 
         # 3. Calculate Metrics
+        periods_per_year = PerformanceAnalyzer.get_periods_per_year(request.interval)
         daily_returns = PerformanceAnalyzer.calculate_daily_returns(df)
+        if len(daily_returns) < 2:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Not enough {request.interval} bars for {request.ticker}; choose a longer period"
+            )
         
-        volatility = RiskAnalyzer.calculate_volatility(daily_returns)
+        volatility = RiskAnalyzer.calculate_volatility(daily_returns, periods_per_year=periods_per_year)
         max_dd = RiskAnalyzer.calculate_max_drawdown(df)
         var_95 = RiskAnalyzer.calculate_historical_var(daily_returns)
+        es_95 = RiskAnalyzer.calculate_historical_es(daily_returns)
+        intervals = RiskAnalyzer.bootstrap_confidence_intervals(
+            daily_returns, periods_per_year=periods_per_year
+        )
         
-        sharpe = PerformanceAnalyzer.calculate_sharpe_ratio(df)
+        sharpe = PerformanceAnalyzer.calculate_sharpe_ratio(df, periods_per_year=periods_per_year)
         cagr = PerformanceAnalyzer.calculate_cagr(df)
         
         current_price = df['Close'].iloc[-1]
@@ -63,9 +119,53 @@ async def analyze_stock(request: AnalysisRequest):
             max_drawdown=round(max_dd, 4),
             cagr=round(cagr, 4),
             value_at_risk_95=round(var_95, 4),
+            expected_shortfall_95=round(es_95, 4),
+            confidence_intervals_95=None if np.isnan(list(intervals.values())).any() else {
+                name: [round(lower, 4), round(upper, 4)] for name, (lower, upper) in intervals.items()
+            },
             company_info=info
         )
 
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/stress", response_model=StressResponse)
+def stress_portfolio(request: StressRequest):
+    # Sync handler: FastAPI runs it in a worker thread, so fallback fetches don't block the event loop
+    if not 1 <= request.rank <= StressTester.TOP_K:
+        raise HTTPException(status_code=400, detail=f"rank must be between 1 and {StressTester.TOP_K}")
+
+    try:
+        persisted = get_persisted_stress_index() if request.period == "max" else None
+        covered = set(persisted['scenario_returns'].columns) if persisted is not None else set()
+        uncovered = [ticker for ticker in request.holdings if ticker not in covered]
+
+        # Only holdings missing from the persisted index are fetched and indexed on demand
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            fetched = dict(zip(uncovered, executor.map(lambda t: get_stress_index(t, request.period), uncovered)))
+        missing = [ticker for ticker, index in fetched.items() if index is None]
+
+        available = [index for index in fetched.values() if index is not None]
+        if persisted is not None and covered.intersection(request.holdings):
+            available.insert(0, persisted)
+        if not available:
+            raise HTTPException(status_code=404, detail="No data found for any holding")
+
+        index = available[0] if len(available) == 1 else StressTester.combine_indexes(available)
+        scenarios = StressTester.apply_scenarios(index, request.holdings)
+        worst = StressTester.apply_worst_windows(index, request.holdings, request.rank)
+        worst.index = [f"{horizon}d" for horizon in worst.index]
+
+        return StressResponse(
+            scenarios=scenarios.round(4).to_dict(orient="index"),
+            worst_windows=worst.round(4).to_dict(orient="index"),
+            missing_tickers=missing
+        )
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
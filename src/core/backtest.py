@@ -0,0 +1,258 @@
+import itertools
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence
+
+class Backtester:
+    """
+    Vectorized backtesting of signal-based trading strategies.
+
+    Every parameter combination and ticker is evaluated in a single array
+    pass: positions, equity curves and metrics are tensors of shape
+    (time, parameter set, ticker) rather than per-run Python loops.
+    """
+
+    # Required grid parameters per strategy, and defaults for optional ones
+    STRATEGIES = {
+        "ma_crossover": ("fast_window", "slow_window"),
+        "momentum": ("lookback",),
+        "volatility_target": ("lookback", "target_vol", "max_leverage"),
+    }
+    DEFAULTS = {"max_leverage": 1.0}
+
+    @staticmethod
+    def build_price_matrix(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Aligns 'Close' prices from several DataLoader frames into a single
+        wide DataFrame indexed by Date (one column per ticker).
+        Only dates present for every ticker are kept.
+        """
+        closes = {}
+        for ticker, df in frames.items():
+            if 'Close' not in df.columns or 'Date' not in df.columns:
+                raise ValueError(f"DataFrame for {ticker} must contain 'Date' and 'Close' columns")
+            closes[ticker] = df.set_index('Date')['Close']
+        return pd.DataFrame(closes).dropna().sort_index()
+
+    @staticmethod
+    def expand_grid(param_grid: Dict[str, Sequence[float]]) -> pd.DataFrame:
+        """Expands a {param: values} grid into one row per combination."""
+        names = list(param_grid)
+        combos = list(itertools.product(*(param_grid[name] for name in names)))
+        return pd.DataFrame(combos, columns=names)
+
+    @staticmethod
+    def _validate_params(strategy: str, params: pd.DataFrame) -> None:
+        """Rejects parameter sets for which the strategy's windows are undefined."""
+        if strategy == "ma_crossover":
+            if (params[['fast_window', 'slow_window']] < 1).any().any():
+                raise ValueError("'fast_window' and 'slow_window' must be at least 1")
+            if (params['fast_window'] >= params['slow_window']).any():
+                raise ValueError("'fast_window' must be smaller than 'slow_window'")
+        elif strategy == "momentum":
+            if (params['lookback'] < 1).any():
+                raise ValueError("'lookback' must be at least 1")
+        elif strategy == "volatility_target":
+            # A sample standard deviation needs at least two returns
+            if (params['lookback'] < 2).any():
+                raise ValueError("'lookback' must be at least 2 for 'volatility_target'")
+
+    @staticmethod
+    def _rolling_sum(cumsum: np.ndarray, windows: np.ndarray, offset: int = 0) -> np.ndarray:
+        """
+        Trailing window sums for many window lengths at once.
+
+        Args:
+            cumsum (np.ndarray): Cumulative sums with a leading zero row, shape (T + 1, N).
+            windows (np.ndarray): Window lengths, shape (P,).
+            offset (int): Number of leading rows that are not valid observations.
+
+        Returns:
+            np.ndarray: Shape (T, P, N); NaN where the window is not yet full.
+        """
+        T = cumsum.shape[0] - 1
+        end = np.arange(1, T + 1)[:, None]          # (T, 1)
+        start = end - windows[None, :]              # (T, P)
+        valid = start >= offset
+        sums = cumsum[end] - cumsum[np.clip(start, 0, None)]
+        sums[~valid] = np.nan
+        return sums
+
+    @staticmethod
+    def generate_positions(prices: np.ndarray, strategy: str, params: pd.DataFrame, periods_per_year: int = 252) -> np.ndarray:
+        """
+        Computes target positions for every parameter set and ticker.
+
+        Args:
+            prices (np.ndarray): Close prices, shape (T, N).
+            strategy (str): One of Backtester.STRATEGIES.
+            params (pd.DataFrame): One row per parameter combination.
+            periods_per_year (int): Bars per year, used to annualize realized volatility.
+
+        Returns:
+            np.ndarray: Positions of shape (T, P, N), decided at each bar's close.
+        """
+        T = prices.shape[0]
+
+        if strategy == "ma_crossover":
+            cumsum = np.vstack([np.zeros((1, prices.shape[1])), np.cumsum(prices, axis=0)])
+            fast = params['fast_window'].to_numpy(dtype=int)
+            slow = params['slow_window'].to_numpy(dtype=int)
+            fast_ma = Backtester._rolling_sum(cumsum, fast) / fast[None, :, None]
+            slow_ma = Backtester._rolling_sum(cumsum, slow) / slow[None, :, None]
+            # Long while the fast average is above the slow one, flat otherwise
+            positions = (fast_ma > slow_ma).astype(float)
+
+        elif strategy == "momentum":
+            lookback = params['lookback'].to_numpy(dtype=int)
+            past_idx = np.arange(T)[:, None] - lookback[None, :]     # (T, P)
+            past = prices[np.clip(past_idx, 0, None)]                # (T, P, N)
+            trailing = prices[:, None, :] / past - 1
+            positions = (trailing > 0).astype(float)
+            positions[past_idx < 0] = 0.0
+
+        elif strategy == "volatility_target":
+            lookback = params['lookback'].to_numpy(dtype=int)
+            target_vol = params['target_vol'].to_numpy(dtype=float)
+            max_leverage = params['max_leverage'].to_numpy(dtype=float)
+
+            returns = np.zeros_like(prices)
+            returns[1:] = prices[1:] / prices[:-1] - 1
+            zeros = np.zeros((1, prices.shape[1]))
+            sum_r = Backtester._rolling_sum(np.vstack([zeros, np.cumsum(returns, axis=0)]), lookback, offset=1)
+            sum_r2 = Backtester._rolling_sum(np.vstack([zeros, np.cumsum(returns**2, axis=0)]), lookback, offset=1)
+
+            n = lookback[None, :, None].astype(float)
+            variance = np.clip((sum_r2 - sum_r**2 / n) / (n - 1), 0, None)
+            realized_vol = np.sqrt(variance * periods_per_year)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                positions = target_vol[None, :, None] / realized_vol
+            positions = np.minimum(positions, max_leverage[None, :, None])
+            positions = np.nan_to_num(positions, nan=0.0, posinf=0.0)
+
+        else:
+            raise ValueError(f"Unknown strategy '{strategy}'. Choose from {list(Backtester.STRATEGIES)}")
+
+        return positions
+
+    @staticmethod
+    def equity_curves(prices: np.ndarray, positions: np.ndarray, transaction_cost: float = 0.001) -> np.ndarray:
+        """
+        Builds equity curves (starting at 1.0) from positions.
+
+        A position decided at bar t earns the return of bar t + 1. Trading
+        costs are charged on turnover as a fraction of traded notional.
+
+        Returns:
+            np.ndarray: Equity of shape (T, P, N).
+        """
+        asset_returns = np.zeros_like(prices)
+        asset_returns[1:] = prices[1:] / prices[:-1] - 1
+
+        held = np.zeros_like(positions)
+        held[1:] = positions[:-1]
+        turnover = np.abs(np.diff(positions, axis=0, prepend=0.0))
+
+        strategy_returns = held * asset_returns[:, None, :] - transaction_cost * turnover
+        return np.cumprod(1 + strategy_returns, axis=0)
+
+    @staticmethod
+    def calculate_metrics(
+        equity: np.ndarray,
+        dates: pd.Series,
+        risk_free_rate: float = 0.02,
+        periods_per_year: int = 252
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sharpe, CAGR and max drawdown for every equity curve at once.
+        Uses the same definitions as PerformanceAnalyzer and RiskAnalyzer,
+        with the equity curve in place of the 'Close' series.
+        """
+        returns = equity[1:] / equity[:-1] - 1
+        mean_return = returns.mean(axis=0)
+        std_dev = returns.std(axis=0, ddof=1)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = (mean_return * periods_per_year - risk_free_rate) / (std_dev * np.sqrt(periods_per_year))
+        sharpe = np.where(std_dev == 0, 0.0, sharpe)
+
+        days = (dates.iloc[-1] - dates.iloc[0]).days
+        years = days / 365.25
+        if years == 0:
+            cagr = np.zeros_like(mean_return)
+        else:
+            cagr = (equity[-1] / equity[0]) ** (1 / years) - 1
+
+        rolling_max = np.maximum.accumulate(equity, axis=0)
+        max_drawdown = ((equity - rolling_max) / rolling_max).min(axis=0)
+
+        return {
+            "sharpe_ratio": sharpe,
+            "cagr": cagr,
+            "max_drawdown": max_drawdown,
+            "total_return": equity[-1] - 1,
+        }
+
+    @staticmethod
+    def run(
+        prices: pd.DataFrame,
+        strategy: str,
+        param_grid: Dict[str, Sequence[float]],
+        transaction_cost: float = 0.001,
+        risk_free_rate: float = 0.02,
+        periods_per_year: int = 252,
+        batch_size: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Runs a parameter sweep of a strategy over many tickers.
+
+        Args:
+            prices (pd.DataFrame): Wide Close prices indexed by Date (see build_price_matrix).
+            strategy (str): 'ma_crossover', 'momentum' or 'volatility_target'.
+            param_grid (dict): Values to sweep per parameter, e.g. {'lookback': [20, 60]}.
+            transaction_cost (float): Cost per unit of turnover (0.001 = 10 bps).
+            risk_free_rate (float): Annual risk-free rate used in the Sharpe Ratio.
+            periods_per_year (int): Bars per year of the price data (252 for daily bars).
+            batch_size (int): Parameter sets evaluated per vectorized pass; defaults to
+                about one million (time, parameter set, ticker) elements per array, so
+                memory stays bounded whatever the history length or universe size.
+
+        Returns:
+            pd.DataFrame: One row per (parameter set, ticker) with the parameters,
+            'ticker', 'sharpe_ratio', 'cagr', 'max_drawdown' and 'total_return'.
+        """
+        if strategy not in Backtester.STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'. Choose from {list(Backtester.STRATEGIES)}")
+        if len(prices) < 2:
+            raise ValueError("At least two price observations are required")
+
+        grid = {**{k: [v] for k, v in Backtester.DEFAULTS.items()}, **param_grid}
+        required = Backtester.STRATEGIES[strategy]
+        missing = [name for name in required if name not in grid]
+        if missing:
+            raise ValueError(f"Missing parameters for '{strategy}': {missing}")
+
+        params = Backtester.expand_grid({name: grid[name] for name in required})
+        Backtester._validate_params(strategy, params)
+        values = prices.to_numpy(dtype=float)
+        dates = pd.Series(pd.to_datetime(prices.index))
+        tickers = list(prices.columns)
+
+        if batch_size is None:
+            batch_size = max(1, 1_000_000 // values.size)
+
+        results: List[pd.DataFrame] = []
+        for start in range(0, len(params), batch_size):
+            batch = params.iloc[start:start + batch_size].reset_index(drop=True)
+            positions = Backtester.generate_positions(values, strategy, batch, periods_per_year)
+            equity = Backtester.equity_curves(values, positions, transaction_cost)
+            metrics = Backtester.calculate_metrics(equity, dates, risk_free_rate, periods_per_year)
+
+            frame = batch.loc[batch.index.repeat(len(tickers))].reset_index(drop=True)
+            frame['ticker'] = tickers * len(batch)
+            for name, value in metrics.items():
+                frame[name] = value.ravel()
+            results.append(frame)
+
+        return pd.concat(results, ignore_index=True)
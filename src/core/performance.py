@@ -5,10 +5,29 @@ class PerformanceAnalyzer:
     """
     Calculates financial performance metrics.
     """
+
+    # Bars per year for each bar interval (252 sessions of 6.5 trading hours)
+    PERIODS_PER_YEAR = {
+        "1m": 252 * 390,
+        "5m": 252 * 78,
+        "15m": 252 * 26,
+        "30m": 252 * 13,
+        "1h": 252 * 7,
+        "1d": 252,
+        "1wk": 52,
+        "1mo": 12,
+    }
+
+    @staticmethod
+    def get_periods_per_year(interval: str) -> int:
+        """Annualization factor for returns sampled at the given bar interval."""
+        if interval not in PerformanceAnalyzer.PERIODS_PER_YEAR:
+            raise ValueError(f"Unsupported interval '{interval}'")
+        return PerformanceAnalyzer.PERIODS_PER_YEAR[interval]
     
     @staticmethod
     def calculate_daily_returns(df: pd.DataFrame) -> pd.Series:
-        """Calculates daily percentage change."""
+        """Calculates percentage change per bar (daily for daily data)."""
         if 'Close' not in df.columns:
             raise ValueError("DataFrame must contain 'Close' column")
         return df['Close'].pct_change().dropna()
@@ -20,10 +39,10 @@ class PerformanceAnalyzer:
         return (1 + daily_returns).cumprod() - 1
 
     @staticmethod
-    def calculate_sharpe_ratio(df: pd.DataFrame, risk_free_rate: float = 0.02) -> float:
+    def calculate_sharpe_ratio(df: pd.DataFrame, risk_free_rate: float = 0.02, periods_per_year: int = 252) -> float:
         """
         Calculates annualized Sharpe Ratio.
-        Assumes 252 trading days.
+        Defaults to daily bars (252 trading days); see get_periods_per_year.
         """
         daily_returns = PerformanceAnalyzer.calculate_daily_returns(df)
         mean_return = daily_returns.mean()
@@ -33,7 +52,7 @@ class PerformanceAnalyzer:
             return 0.0
             
         # Annualize
-        sharpe = (mean_return * 252 - risk_free_rate) / (std_dev * np.sqrt(252))
+        sharpe = (mean_return * periods_per_year - risk_free_rate) / (std_dev * np.sqrt(periods_per_year))
         return sharpe
 
     @staticmethod
@@ -1,5 +1,8 @@
+import os
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 
 class RiskAnalyzer:
     """
@@ -7,11 +10,14 @@ class RiskAnalyzer:
     """
     
     @staticmethod
-    def calculate_volatility(daily_returns: pd.Series, annualized: bool = True) -> float:
-        """Calculates volatility (standard deviation of returns)."""
+    def calculate_volatility(daily_returns: pd.Series, annualized: bool = True, periods_per_year: int = 252) -> float:
+        """
+        Calculates volatility (standard deviation of returns).
+        Annualized with `periods_per_year` bars per year (252 for daily bars).
+        """
         vol = daily_returns.std()
         if annualized:
-            vol *= np.sqrt(252)
+            vol *= np.sqrt(periods_per_year)
         return vol
 
     @staticmethod
@@ -49,3 +55,138 @@ class RiskAnalyzer:
         Calculates Value at Risk (VaR) using historical simulation.
         """
         return daily_returns.quantile(1 - confidence_level)
+
+    @staticmethod
+    def calculate_expected_shortfall(daily_returns: pd.Series, confidence_level: float = 0.95) -> float:
+        """
+        Calculates Expected Shortfall (ES / CVaR) using the parametric method.
+        ES is the expected return given that the loss exceeds the VaR threshold.
+        """
+        mean = daily_returns.mean()
+        std = daily_returns.std()
+
+        from scipy.stats import norm
+        alpha = 1 - confidence_level
+        es = mean - std * norm.pdf(norm.ppf(alpha)) / alpha
+        return es # This is the expected return in the tail
+
+    @staticmethod
+    def calculate_historical_es(daily_returns: pd.Series, confidence_level: float = 0.95) -> float:
+        """
+        Calculates Expected Shortfall (ES / CVaR) using historical simulation.
+        """
+        var = RiskAnalyzer.calculate_historical_var(daily_returns, confidence_level)
+        return daily_returns[daily_returns <= var].mean()
+
+    @staticmethod
+    def block_bootstrap_indices(
+        n: int,
+        n_resamples: int,
+        block_size: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """
+        Draws circular block-bootstrap indices for all resamples at once.
+
+        Returns:
+            np.ndarray: Integer array of shape (n_resamples, n).
+        """
+        n_blocks = -(-n // block_size)
+        starts = rng.integers(0, n, size=(n_resamples, n_blocks))
+        idx = (starts[:, :, None] + np.arange(block_size)) % n
+        return idx.reshape(n_resamples, -1)[:, :n]
+
+    @staticmethod
+    def _resample_statistics(
+        samples: np.ndarray,
+        confidence_level: float,
+        risk_free_rate: float,
+        periods_per_year: int
+    ) -> np.ndarray:
+        """
+        Evaluates historical VaR, historical ES, Sharpe Ratio and Max Drawdown
+        for every row of a (resamples, n) matrix of returns.
+        """
+        var = np.quantile(samples, 1 - confidence_level, axis=1)
+        in_tail = samples <= var[:, None]
+        es = (samples * in_tail).sum(axis=1) / in_tail.sum(axis=1)
+
+        mean_return = samples.mean(axis=1)
+        std_dev = samples.std(axis=1, ddof=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe = (mean_return * periods_per_year - risk_free_rate) / (std_dev * np.sqrt(periods_per_year))
+        sharpe = np.where(std_dev == 0, 0.0, sharpe)
+
+        prices = np.cumprod(np.hstack([np.ones((len(samples), 1)), 1 + samples]), axis=1)
+        rolling_max = np.maximum.accumulate(prices, axis=1)
+        max_dd = ((prices - rolling_max) / rolling_max).min(axis=1)
+
+        return np.column_stack([var, es, sharpe, max_dd])
+
+    @staticmethod
+    def bootstrap_confidence_intervals(
+        daily_returns: pd.Series,
+        confidence_level: float = 0.95,
+        interval_level: float = 0.95,
+        n_resamples: int = 2000,
+        block_size: Optional[int] = None,
+        risk_free_rate: float = 0.02,
+        periods_per_year: int = 252,
+        n_jobs: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        random_state: Optional[int] = None
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Block-bootstrap confidence intervals for VaR, ES, Sharpe Ratio and Max Drawdown.
+
+        Resamples are processed in chunks spread across threads: each chunk draws
+        its indices as one batched array from its own seeded generator and
+        evaluates the statistics vectorized, so memory stays bounded by the chunk.
+
+        Args:
+            daily_returns (pd.Series): Per-bar returns.
+            confidence_level (float): Confidence level of the VaR and ES being estimated.
+            interval_level (float): Coverage of the percentile confidence intervals.
+            n_resamples (int): Number of bootstrap resamples.
+            block_size (int): Block length; defaults to n ** (1/3) to preserve autocorrelation.
+            risk_free_rate (float): Annual risk-free rate used in the Sharpe Ratio.
+            periods_per_year (int): Bars per year (252 for daily bars).
+            n_jobs (int): Worker threads; defaults to the number of CPUs.
+            chunk_size (int): Resamples per chunk; defaults to about one million
+                resampled returns per chunk.
+            random_state (int): Seed for reproducible resamples.
+
+        Returns:
+            dict: {'var', 'expected_shortfall', 'sharpe_ratio', 'max_drawdown'} -> (lower, upper).
+            Bounds are NaN when there are fewer than two returns.
+        """
+        names = ["var", "expected_shortfall", "sharpe_ratio", "max_drawdown"]
+        returns = daily_returns.dropna().to_numpy(dtype=float)
+        n = len(returns)
+        if n < 2:
+            return {name: (np.nan, np.nan) for name in names}
+
+        if block_size is None:
+            block_size = max(1, int(round(n ** (1 / 3))))
+        block_size = min(block_size, n)
+
+        if chunk_size is None:
+            chunk_size = max(1, 1_000_000 // n)
+        sizes = [min(chunk_size, n_resamples - start) for start in range(0, n_resamples, chunk_size)]
+        generators = np.random.default_rng(random_state).spawn(len(sizes))
+
+        def evaluate(size: int, rng: np.random.Generator) -> np.ndarray:
+            idx = RiskAnalyzer.block_bootstrap_indices(n, size, block_size, rng)
+            return RiskAnalyzer._resample_statistics(
+                returns[idx], confidence_level, risk_free_rate, periods_per_year
+            )
+
+        # NumPy releases the GIL in its kernels, so threads share the work without copying data
+        n_jobs = n_jobs or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=min(n_jobs, len(sizes))) as executor:
+            stats = np.vstack(list(executor.map(evaluate, sizes, generators)))
+
+        tail = (1 - interval_level) / 2
+        lower, upper = np.quantile(stats, [tail, 1 - tail], axis=0)
+
+        return {name: (float(lower[i]), float(upper[i])) for i, name in enumerate(names)}
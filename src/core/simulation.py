@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 
 class MonteCarloSimulator:
     """
@@ -51,6 +51,56 @@ class MonteCarloSimulator:
             
         return price_paths
 
+    @staticmethod
+    def simulate_garch_prices(
+        start_price: float,
+        mu: float,
+        omega: float,
+        alpha: float,
+        beta: float,
+        gamma: float = 0.0,
+        last_variance: Optional[float] = None,
+        last_residual: float = 0.0,
+        days: int = 252,
+        simulations: int = 1000
+    ) -> np.ndarray:
+        """
+        Simulates future stock prices with path-wise GARCH(1,1) / GJR-GARCH(1,1) variance.
+
+        Args:
+            start_price (float): The current stock price.
+            mu (float): Annualized expected return (drift).
+            omega, alpha, beta, gamma (float): Daily GARCH parameters (see GarchModel.fit).
+            last_variance (float): Latest conditional daily variance; defaults to the long-run variance.
+            last_residual (float): Latest return shock, which drives the first variance update.
+            days (int): Number of days to simulate.
+            simulations (int): Number of simulation paths.
+
+        Returns:
+            np.ndarray: Array of shape (days, simulations) containing simulated prices.
+        """
+        dt = 1 / 252  # Time step (1 day)
+
+        if last_variance is None:
+            last_variance = omega / (1 - alpha - beta - 0.5 * gamma)
+
+        shock = np.random.normal(0, 1, (days, simulations))
+
+        price_paths = np.zeros((days, simulations))
+        price_paths[0] = start_price
+
+        # Each path carries its own variance, updated from its own shocks
+        variance = np.full(simulations, last_variance)
+        residual = np.full(simulations, last_residual)
+
+        for t in range(1, days):
+            variance = omega + (alpha + gamma * (residual < 0)) * residual**2 + beta * variance
+            residual = np.sqrt(variance) * shock[t]
+            daily_log_return = mu * dt - 0.5 * variance + residual
+            price_paths[t] = price_paths[t-1] * np.exp(daily_log_return)
+
+        return price_paths
+
     @staticmethod
     def get_simulation_stats(price_paths: np.ndarray) -> dict:
         """
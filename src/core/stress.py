@@ -0,0 +1,295 @@
+import numpy as np
+import pandas as pd
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+class StressTester:
+    """
+    Historical stress testing against named crises and worst rolling windows.
+
+    Scenario returns and worst-window losses are precomputed once per ticker
+    into an index, so applying a scenario to a portfolio is a lookup plus a
+    weighted sum instead of a rescan of price history.
+    """
+
+    CRISIS_WINDOWS = {
+        "2000-02 Dot-com Bust": ("2000-03-10", "2002-10-09"),
+        "2008 Global Financial Crisis": ("2008-09-01", "2009-03-09"),
+        "2011 US Downgrade": ("2011-07-22", "2011-10-03"),
+        "2018 Q4 Selloff": ("2018-09-20", "2018-12-24"),
+        "2020 COVID-19 Crash": ("2020-02-19", "2020-03-23"),
+        "2022 Rate Shock": ("2022-01-03", "2022-10-12"),
+    }
+    HORIZONS = (10, 21, 63)
+    TOP_K = 5
+
+    # Slack for windows that start or end on a market holiday
+    COVERAGE_TOLERANCE = pd.Timedelta(days=5)
+
+    @staticmethod
+    def _naive_dates(index: pd.Index) -> pd.DatetimeIndex:
+        """Drops timezone information so windows can be given as plain dates."""
+        dates = pd.DatetimeIndex(pd.to_datetime(index))
+        if dates.tz is not None:
+            dates = dates.tz_localize(None)
+        return dates
+
+    @staticmethod
+    def calculate_scenario_returns(
+        prices: pd.DataFrame,
+        scenarios: Dict[str, Tuple[str, str]]
+    ) -> pd.DataFrame:
+        """
+        Returns of every ticker over each named (start, end) window.
+
+        Args:
+            prices (pd.DataFrame): Wide Close prices indexed by Date, one column per ticker.
+            scenarios (dict): {name: (start_date, end_date)}.
+
+        Returns:
+            pd.DataFrame: Shape (scenarios, tickers); NaN where a ticker's history
+            does not span the whole window.
+        """
+        dates = StressTester._naive_dates(prices.index)
+        values = prices.to_numpy(dtype=float)
+        observed = ~np.isnan(values)
+        has_data = observed.any(axis=0)
+        first = dates[np.where(has_data, observed.argmax(axis=0), 0)]
+        last = dates[np.where(has_data, len(dates) - 1 - observed[::-1].argmax(axis=0), 0)]
+
+        rows = []
+        for start, end in scenarios.values():
+            start, end = pd.Timestamp(start), pd.Timestamp(end)
+            i0 = dates.searchsorted(start, side='left')
+            i1 = dates.searchsorted(end, side='right') - 1
+            if i0 >= i1:
+                rows.append(np.full(values.shape[1], np.nan))
+                continue
+            spans = (
+                has_data
+                & (first <= start + StressTester.COVERAGE_TOLERANCE)
+                & (last >= end - StressTester.COVERAGE_TOLERANCE)
+            )
+            rows.append(np.where(spans, values[i1] / values[i0] - 1, np.nan))
+        return pd.DataFrame(rows, index=list(scenarios), columns=prices.columns)
+
+    @staticmethod
+    def find_worst_windows(prices: pd.DataFrame, horizon: int, top_k: int = TOP_K, direction: str = "fall") -> pd.DataFrame:
+        """
+        Top-k worst non-overlapping moves within `horizon` bars, per ticker.
+
+        direction='fall' finds peak-to-trough losses (worst for long holders);
+        direction='rise' finds trough-to-peak gains (worst for short holders).
+        The trailing extremum over each window comes from a sliding-window filter,
+        so a full scan is O(n) per ticker regardless of the horizon.
+
+        Returns:
+            pd.DataFrame: Columns [ticker, horizon, rank, direction, start, end, move, loss].
+            'move' is the price change over the window (negative for falls, positive
+            for rises); 'loss' is the return to the holder it hurts (long for falls,
+            short for rises), so it is never positive.
+        """
+        if direction not in ("fall", "rise"):
+            raise ValueError("direction must be 'fall' or 'rise'")
+
+        dates = prices.index
+        values = prices.to_numpy(dtype=float)
+        T, N = values.shape
+        size = horizon + 1
+        origin = (size - 1) // 2
+
+        # Pre-listing gaps must not act as window extremes
+        if direction == "fall":
+            filled = np.where(np.isnan(values), -np.inf, values)
+            extreme = maximum_filter1d(filled, size=size, axis=0, origin=origin, mode='nearest')
+        else:
+            filled = np.where(np.isnan(values), np.inf, values)
+            extreme = minimum_filter1d(filled, size=size, axis=0, origin=origin, mode='nearest')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            moves = values / extreme - 1
+        moves[~np.isfinite(moves)] = np.nan
+        # Worst window = lowest score in either direction
+        losses = moves if direction == "fall" else -moves
+
+        positions = np.arange(T)[:, None]
+        columns = np.arange(N)
+        records = []
+        for rank in range(1, top_k + 1):
+            available = ~np.isnan(losses).all(axis=0)
+            if not available.any():
+                break
+            end = np.nanargmin(np.where(available, losses, 0.0), axis=0)
+            worst = moves[end, columns]
+
+            # Peak (or trough) of each selected window
+            window = np.clip(end[:, None] - horizon + np.arange(size), 0, None)
+            window_prices = filled[window, columns[:, None]]
+            pick = np.argmax if direction == "fall" else np.argmin
+            start = window[columns, pick(window_prices, axis=1)]
+
+            picked = np.flatnonzero(available)
+            records.append(pd.DataFrame({
+                'ticker': prices.columns[picked],
+                'horizon': horizon,
+                'rank': rank,
+                'direction': direction,
+                'start': dates[start[picked]],
+                'end': dates[end[picked]],
+                'move': worst[picked],
+                'loss': worst[picked] if direction == "fall" else -worst[picked],
+            }))
+
+            # Later picks may not overlap the chosen windows
+            overlap = (positions >= start) & (positions <= end + horizon)
+            losses[overlap & available] = np.nan
+
+        if not records:
+            return pd.DataFrame(columns=['ticker', 'horizon', 'rank', 'direction', 'start', 'end', 'move', 'loss'])
+        return pd.concat(records, ignore_index=True)
+
+    @staticmethod
+    def build_index(
+        prices: pd.DataFrame,
+        horizons: Sequence[int] = HORIZONS,
+        top_k: int = TOP_K,
+        scenarios: Optional[Dict[str, Tuple[str, str]]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Builds the stress index for a set of tickers.
+
+        Args:
+            prices (pd.DataFrame): Wide daily Close prices indexed by Date, one column per ticker.
+            horizons (sequence): Window lengths in bars (e.g. 10, 21, 63 trading days).
+            top_k (int): Number of worst windows kept per ticker and horizon.
+            scenarios (dict): Named windows; defaults to StressTester.CRISIS_WINDOWS.
+
+        Returns:
+            dict: 'scenario_returns' (scenarios x tickers), 'worst_losses' and
+            'worst_rises' ((horizon, rank) x tickers) and 'worst_windows'
+            (long table with dates).
+        """
+        if scenarios is None:
+            scenarios = StressTester.CRISIS_WINDOWS
+
+        worst_windows = pd.concat(
+            [
+                StressTester.find_worst_windows(prices, h, top_k, direction)
+                for direction in ("fall", "rise") for h in horizons
+            ],
+            ignore_index=True
+        )
+
+        # Every (horizon, rank) slot is kept, NaN where a history is too short to fill it
+        slots = pd.MultiIndex.from_product([list(horizons), range(1, top_k + 1)], names=['horizon', 'rank'])
+
+        def pivot(direction: str) -> pd.DataFrame:
+            rows = worst_windows[worst_windows['direction'] == direction]
+            if rows.empty:
+                return pd.DataFrame(np.nan, index=slots, columns=prices.columns)
+            table = rows.set_index(['horizon', 'rank', 'ticker'])['move'].astype(float).unstack('ticker')
+            return table.reindex(index=slots, columns=prices.columns)
+
+        return {
+            "scenario_returns": StressTester.calculate_scenario_returns(prices, scenarios),
+            "worst_losses": pivot("fall"),
+            "worst_rises": pivot("rise"),
+            "worst_windows": worst_windows,
+        }
+
+    @staticmethod
+    def combine_indexes(indexes: List[Dict[str, pd.DataFrame]]) -> Dict[str, pd.DataFrame]:
+        """Merges indexes built for separate tickers (e.g. one per cached price series)."""
+        return {
+            "scenario_returns": pd.concat([ix['scenario_returns'] for ix in indexes], axis=1),
+            "worst_losses": pd.concat([ix['worst_losses'] for ix in indexes], axis=1),
+            "worst_rises": pd.concat([ix['worst_rises'] for ix in indexes], axis=1),
+            "worst_windows": pd.concat([ix['worst_windows'] for ix in indexes], ignore_index=True),
+        }
+
+    @staticmethod
+    def save_index(index: Dict[str, pd.DataFrame], path: str) -> None:
+        """Persists a stress index to disk."""
+        pd.to_pickle(index, path)
+
+    @staticmethod
+    def load_index(path: str) -> Dict[str, pd.DataFrame]:
+        """Loads a stress index saved with save_index."""
+        return pd.read_pickle(path)
+
+    @staticmethod
+    def _weighted_impact(table: pd.DataFrame, holdings: Union[Dict[str, float], pd.Series]) -> pd.DataFrame:
+        """Weighted sum of per-ticker returns for every row of `table`."""
+        holdings = pd.Series(holdings, dtype=float)
+        returns = table.reindex(columns=holdings.index).to_numpy(dtype=float)
+        weights = holdings.to_numpy()
+
+        covered = ~np.isnan(returns)
+        pnl = np.where(covered, returns, 0.0) @ weights
+        covered_weight = covered @ np.abs(weights)
+        total = np.abs(weights).sum()
+
+        return pd.DataFrame({
+            "pnl": pnl,
+            "portfolio_return": pnl / total if total else 0.0,
+            "coverage": covered_weight / total if total else 0.0,
+        }, index=table.index)
+
+    @staticmethod
+    def apply_scenarios(
+        index: Dict[str, pd.DataFrame],
+        holdings: Union[Dict[str, float], pd.Series],
+        scenarios: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Applies named scenarios to a portfolio.
+
+        Args:
+            index (dict): Output of build_index / combine_indexes.
+            holdings (dict or pd.Series): Ticker -> weight or market value.
+            scenarios (list): Scenario names to apply; defaults to all.
+
+        Returns:
+            pd.DataFrame: Per scenario: 'pnl' (in holding units), 'portfolio_return'
+            and 'coverage' (share of gross holdings with data in the window).
+        """
+        table = index['scenario_returns']
+        if scenarios is not None:
+            table = table.loc[scenarios]
+        return StressTester._weighted_impact(table, holdings)
+
+    @staticmethod
+    def apply_worst_windows(
+        index: Dict[str, pd.DataFrame],
+        holdings: Union[Dict[str, float], pd.Series],
+        rank: int = 1
+    ) -> pd.DataFrame:
+        """
+        Sums each holding's own rank-th worst move per horizon: the worst fall
+        for long positions and the worst rise for short (negative) positions.
+
+        Holdings' worst windows need not coincide, so this is a conservative
+        bound rather than a loss the portfolio actually experienced.
+
+        Holdings whose history is too short to have a rank-th window count as
+        uncovered rather than raising.
+
+        Returns:
+            pd.DataFrame: Indexed by horizon with 'pnl', 'portfolio_return' and 'coverage'.
+        """
+        slots = index['worst_losses'].index
+        top_k = slots.get_level_values('rank').max()
+        if not 1 <= rank <= top_k:
+            raise ValueError(f"rank must be between 1 and {top_k}")
+
+        holdings = pd.Series(holdings, dtype=float)
+        horizons = slots.get_level_values('horizon').unique()
+        wanted = pd.MultiIndex.from_product([horizons, [rank]], names=['horizon', 'rank'])
+
+        def select(table: pd.DataFrame) -> pd.DataFrame:
+            return table.reindex(index=wanted, columns=holdings.index).droplevel('rank')
+
+        falls = select(index['worst_losses'])
+        rises = select(index['worst_rises'])
+        short = np.broadcast_to((holdings < 0).to_numpy(), falls.shape)
+        table = falls.where(~short, rises)
+        return StressTester._weighted_impact(table, holdings)
@@ -0,0 +1,292 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple, Union
+
+class GarchModel:
+    """
+    GARCH(1,1) and GJR-GARCH(1,1) conditional volatility estimation.
+
+    A whole universe of tickers is fitted at once: the variance recursion and
+    its analytic scores run over time with every step vectorized across tickers,
+    and a batched BHHH optimizer updates all parameter vectors together.
+    """
+
+    PARAMS = ["omega", "alpha", "gamma", "beta"]
+    RESULT_COLUMNS = [
+        "mu", "omega", "alpha", "gamma", "beta", "persistence", "long_run_variance",
+        "last_variance", "last_residual", "log_likelihood", "iterations", "converged",
+    ]
+
+    # Returns are fitted in percent to keep the optimization well scaled
+    SCALE = 100.0
+
+    @staticmethod
+    def _filter(
+        eps: np.ndarray,
+        valid: np.ndarray,
+        h0: np.ndarray,
+        theta: np.ndarray,
+        free: list,
+        with_scores: bool = False
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Runs the variance recursion h_t = omega + (alpha + gamma * 1[eps < 0]) * eps_{t-1}^2 + beta * h_{t-1}.
+
+        Args:
+            eps (np.ndarray): Demeaned returns, zero where missing, shape (T, N).
+            valid (np.ndarray): Observation mask, shape (T, N).
+            h0 (np.ndarray): Initial variance per ticker, shape (N,).
+            theta (np.ndarray): Parameters [omega, alpha, gamma, beta], shape (N, 4).
+            free (list): Indices of the parameters being estimated.
+            with_scores (bool): Also accumulate the score and its outer product (BHHH).
+
+        Returns:
+            tuple: (log_likelihood, last_variance, last_residual[, score, outer_product]).
+        """
+        T, N = eps.shape
+        k = len(free)
+        omega, alpha, gamma, beta = theta.T
+        eps2 = eps ** 2
+        neg2 = eps2 * (eps < 0)
+
+        h = h0.copy()
+        h_last = h0.copy()
+        eps_last = np.zeros(N)
+        log_likelihood = np.zeros(N)
+        if with_scores:
+            dh = np.zeros((N, 4))
+            score = np.zeros((N, k))
+            outer = np.zeros((N, k, k))
+
+        for t in range(T):
+            if t > 0:
+                # Missing observations leave the variance (and its derivatives) unchanged
+                step = valid[t - 1]
+                if with_scores:
+                    z = np.column_stack([np.ones(N), eps2[t - 1], neg2[t - 1], h])
+                    dh = np.where(step[:, None], z + beta[:, None] * dh, dh)
+                h = np.where(step, omega + alpha * eps2[t - 1] + gamma * neg2[t - 1] + beta * h, h)
+
+            v = valid[t]
+            log_likelihood -= np.where(v, 0.5 * (np.log(2 * np.pi) + np.log(h) + eps2[t] / h), 0.0)
+            h_last = np.where(v, h, h_last)
+            eps_last = np.where(v, eps[t], eps_last)
+
+            if with_scores:
+                s = (0.5 * (eps2[t] / h - 1) / h * v)[:, None] * dh[:, free]
+                score += s
+                outer += s[:, :, None] * s[:, None, :]
+
+        if with_scores:
+            return log_likelihood, h_last, eps_last, score, outer
+        return log_likelihood, h_last, eps_last
+
+    @staticmethod
+    def _is_feasible(theta: np.ndarray) -> np.ndarray:
+        """Positivity and covariance-stationarity constraints, per ticker."""
+        omega, alpha, gamma, beta = theta.T
+        return (
+            (omega > 0) & (alpha >= 0) & (gamma >= 0) & (beta >= 0)
+            & (alpha + beta + 0.5 * gamma < 0.9999)
+        )
+
+    @staticmethod
+    def fit(
+        returns: Union[pd.Series, pd.DataFrame],
+        asymmetric: bool = False,
+        initial_params: Optional[pd.DataFrame] = None,
+        max_iter: int = 200,
+        tol: float = 1e-9
+    ) -> pd.DataFrame:
+        """
+        Fits GARCH(1,1) (or GJR-GARCH(1,1) when asymmetric) to every column of `returns`.
+
+        Args:
+            returns (pd.Series or pd.DataFrame): Per-bar returns, one column per ticker.
+                Missing values (e.g. before a listing date) are skipped. Tickers with fewer
+                than 10 observations or zero variance get NaN parameters and converged=False.
+            asymmetric (bool): Estimate the GJR leverage term gamma; otherwise gamma = 0.
+            initial_params (pd.DataFrame): Output of a previous fit, used to warm-start
+                the optimizer when refitting on extended history.
+            max_iter (int): Maximum optimizer iterations.
+            tol (float): Relative log-likelihood improvement at which a ticker has converged.
+
+        Returns:
+            pd.DataFrame: One row per ticker with mu, omega, alpha, gamma, beta, persistence,
+            long_run_variance, last_variance, last_residual, log_likelihood, iterations, converged.
+        """
+        if isinstance(returns, pd.Series):
+            returns = returns.to_frame(name=returns.name or 'returns')
+
+        # Thin or constant (e.g. halted) series are left out rather than failing the universe
+        fittable = (returns.count() >= 10).to_numpy() & (returns.var(ddof=0).fillna(0) > 0).to_numpy()
+        if not fittable.all():
+            if fittable.any():
+                fitted = GarchModel.fit(returns.loc[:, fittable], asymmetric, initial_params, max_iter, tol)
+            else:
+                fitted = pd.DataFrame(columns=GarchModel.RESULT_COLUMNS, dtype=float)
+            result = fitted.reindex(returns.columns)
+            result['iterations'] = result['iterations'].fillna(0).astype(int)
+            result['converged'] = result['converged'].fillna(False).astype(bool)
+            return result
+
+        scale = GarchModel.SCALE
+        values = returns.to_numpy(dtype=float) * scale
+        valid = ~np.isnan(values)
+        n_obs = valid.sum(axis=0)
+
+        mu = np.nanmean(values, axis=0)
+        eps = np.where(valid, values - mu, 0.0)
+        h0 = np.nanvar(values, axis=0)
+        N = eps.shape[1]
+
+        free = [0, 1, 2, 3] if asymmetric else [0, 1, 3]
+
+        # Default starting point; overridden per ticker by a previous fit
+        theta = np.column_stack([
+            h0 * 0.05,
+            np.full(N, 0.03 if asymmetric else 0.05),
+            np.full(N, 0.04 if asymmetric else 0.0),
+            np.full(N, 0.90),
+        ])
+        if initial_params is not None:
+            known = returns.columns.isin(initial_params.index)
+            if known.any():
+                prior = initial_params.loc[returns.columns[known], GarchModel.PARAMS].to_numpy(dtype=float, copy=True)
+                prior[:, 0] *= scale ** 2
+                if not asymmetric:
+                    prior[:, 2] = 0.0
+                usable = GarchModel._is_feasible(prior)
+                theta[np.flatnonzero(known)[usable]] = prior[usable]
+
+        ll, h_last, eps_last, score, outer = GarchModel._filter(eps, valid, h0, theta, free, with_scores=True)
+        iterations = np.zeros(N, dtype=int)
+        converged = np.zeros(N, dtype=bool)
+        k = len(free)
+
+        for _ in range(max_iter):
+            active = np.flatnonzero(~converged)
+            if active.size == 0:
+                break
+            iterations[active] += 1
+
+            # BHHH direction: outer product of scores approximates the information matrix
+            ridge = 1e-8 * np.trace(outer[active], axis1=1, axis2=2)[:, None, None] * np.eye(k)
+            direction = np.linalg.solve(outer[active] + ridge, score[active][:, :, None])[:, :, 0]
+
+            step = np.ones(active.size)
+            accepted = np.zeros(active.size, dtype=bool)
+            candidate = theta[active].copy()
+            for _ in range(30):
+                pending = np.flatnonzero(~accepted)
+                if pending.size == 0:
+                    break
+                trial = theta[active[pending]].copy()
+                trial[:, free] += step[pending, None] * direction[pending]
+                feasible = GarchModel._is_feasible(trial)
+
+                improved = np.zeros(pending.size, dtype=bool)
+                if feasible.any():
+                    cols = active[pending[feasible]]
+                    trial_ll = GarchModel._filter(eps[:, cols], valid[:, cols], h0[cols], trial[feasible], free)[0]
+                    improved[feasible] = trial_ll >= ll[cols]
+
+                candidate[pending[improved]] = trial[improved]
+                accepted[pending[improved]] = True
+                step[pending[~improved]] *= 0.5
+
+            # Tickers where no step improves the likelihood are at an optimum
+            converged[active[~accepted]] = True
+            moved = active[accepted]
+            if moved.size == 0:
+                continue
+
+            previous_ll = ll[moved]
+            theta[moved] = candidate[accepted]
+            ll[moved], h_last[moved], eps_last[moved], score[moved], outer[moved] = GarchModel._filter(
+                eps[:, moved], valid[:, moved], h0[moved], theta[moved], free, with_scores=True
+            )
+            converged[moved] |= (ll[moved] - previous_ll) <= tol * (1 + np.abs(previous_ll))
+
+        converged &= np.isfinite(ll)
+
+        omega, alpha, gamma, beta = theta.T
+        persistence = alpha + beta + 0.5 * gamma
+        return pd.DataFrame({
+            "mu": mu / scale,
+            "omega": omega / scale ** 2,
+            "alpha": alpha,
+            "gamma": gamma,
+            "beta": beta,
+            "persistence": persistence,
+            "long_run_variance": omega / (1 - persistence) / scale ** 2,
+            "last_variance": h_last / scale ** 2,
+            "last_residual": eps_last / scale,
+            "log_likelihood": ll + n_obs * np.log(scale),
+            "iterations": iterations,
+            "converged": converged,
+        }, index=returns.columns)
+
+    @staticmethod
+    def update_variance(params: pd.DataFrame, new_returns: Union[pd.Series, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Rolls the conditional variance forward over newly arrived bars without refitting.
+
+        Returns:
+            pd.DataFrame: Copy of `params` with last_variance and last_residual updated.
+        """
+        if isinstance(new_returns, pd.Series):
+            if new_returns.name is None and len(params) != 1:
+                raise ValueError("An unnamed Series can only update a single-ticker fit; pass a DataFrame")
+            new_returns = new_returns.to_frame(name=new_returns.name if new_returns.name is not None else params.index[0])
+        missing = new_returns.columns.difference(params.index)
+        if len(missing):
+            raise ValueError(f"No fitted parameters for: {list(missing)}")
+
+        updated = params.copy()
+        p = params.loc[new_returns.columns]
+        values = new_returns.to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+
+        h = p['last_variance'].to_numpy(dtype=float)
+        eps_prev = p['last_residual'].to_numpy(dtype=float)
+        omega, alpha, gamma, beta = p[GarchModel.PARAMS].to_numpy(dtype=float).T
+        mu = p['mu'].to_numpy(dtype=float)
+
+        for t in range(len(values)):
+            v = valid[t]
+            h_next = omega + (alpha + gamma * (eps_prev < 0)) * eps_prev ** 2 + beta * h
+            h = np.where(v, h_next, h)
+            eps_prev = np.where(v, values[t] - mu, eps_prev)
+
+        updated.loc[new_returns.columns, 'last_variance'] = h
+        updated.loc[new_returns.columns, 'last_residual'] = eps_prev
+        return updated
+
+    @staticmethod
+    def forecast_volatility(
+        params: pd.DataFrame,
+        horizon: int = 21,
+        annualized: bool = True,
+        periods_per_year: int = 252
+    ) -> pd.DataFrame:
+        """
+        Conditional volatility forecasts for the next `horizon` bars.
+
+        Returns:
+            pd.DataFrame: Shape (horizon, tickers), indexed by steps ahead (1..horizon).
+        """
+        omega, alpha, gamma, beta = params[GarchModel.PARAMS].to_numpy(dtype=float).T
+        h_T = params['last_variance'].to_numpy(dtype=float)
+        eps_T = params['last_residual'].to_numpy(dtype=float)
+        persistence = params['persistence'].to_numpy(dtype=float)
+        long_run = params['long_run_variance'].to_numpy(dtype=float)
+
+        h_next = omega + (alpha + gamma * (eps_T < 0)) * eps_T ** 2 + beta * h_T
+        steps = np.arange(horizon)[:, None]
+        variance = long_run + persistence ** steps * (h_next - long_run)
+
+        vol = np.sqrt(variance)
+        if annualized:
+            vol *= np.sqrt(periods_per_year)
+        return pd.DataFrame(vol, index=pd.RangeIndex(1, horizon + 1, name='step'), columns=params.index)
@@ -1,39 +1,169 @@
+import time
 import yfinance as yf
 import pandas as pd
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 class DataLoader:
     """
     Handles data ingestion from external sources like Yahoo Finance.
     """
-    
+
+    # Supported bar intervals, finest first
+    INTERVALS = ["1m", "5m", "15m", "30m", "1h", "1d", "1wk", "1mo"]
+
+    # pandas resample rules used to derive coarser bars locally
+    RESAMPLE_RULES = {
+        "5m": "5min",
+        "15m": "15min",
+        "30m": "30min",
+        "1h": "1h",
+        "1d": "1D",
+        "1wk": "W-MON",
+        "1mo": "MS",
+    }
+
+    OHLCV_AGGREGATION = {
+        "Open": "first",
+        "High": "max",
+        "Low": "min",
+        "Close": "last",
+        "Volume": "sum",
+        "Dividends": "sum",
+        "Stock Splits": "max",
+    }
+
+    # Finest series fetched per (ticker, period): (interval, fetched_at, data, derived artifacts)
+    CACHE_TTL_SECONDS = 900
+    _cache: Dict[Tuple[str, str], Tuple[str, float, pd.DataFrame, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def can_resample(source: str, target: str) -> bool:
+        """
+        Whether bars of the `source` interval can be aggregated into `target` bars.
+        Weekly bars straddle month boundaries, so monthly bars need daily or finer data.
+        """
+        if source == target:
+            return True
+        if source == "1wk":
+            return False
+        return DataLoader.INTERVALS.index(source) < DataLoader.INTERVALS.index(target)
+
+    @staticmethod
+    def resample_ohlcv(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+        """
+        Aggregates OHLCV bars into a coarser interval.
+
+        Args:
+            df (pd.DataFrame): Bars with a 'Date' column and OHLCV columns.
+            interval (str): Target interval (e.g., '1h', '1d', '1wk').
+
+        Returns:
+            pd.DataFrame: Resampled bars, labelled by bar start, with 'Date' as a column.
+        """
+        if interval not in DataLoader.RESAMPLE_RULES:
+            raise ValueError(f"Cannot resample to interval '{interval}'")
+
+        rule = DataLoader.RESAMPLE_RULES[interval]
+        aggregation = {col: how for col, how in DataLoader.OHLCV_AGGREGATION.items() if col in df.columns}
+
+        # Intraday bins are anchored on the first bar so hourly bars start at the session open
+        origin = "start" if interval in ("5m", "15m", "30m", "1h") else "start_day"
+        if interval in ("1wk", "1mo"):
+            resampled = df.set_index('Date').resample(rule, label="left", closed="left").agg(aggregation)
+        else:
+            resampled = df.set_index('Date').resample(rule, origin=origin).agg(aggregation)
+
+        resampled = resampled.dropna(subset=['Close'])
+        resampled.index.name = 'Date'
+        return resampled.reset_index()
+
     @staticmethod
     def fetch_stock_data(ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
         """
         Fetches historical stock data for a given ticker.
-        
+
+        The finest series fetched for a ticker and period is cached; requests for
+        coarser intervals are resampled from it locally instead of refetched.
+
         Args:
             ticker (str): Stock symbol (e.g., 'AAPL').
             period (str): Data period (e.g., '1y', '5y', 'max').
-            interval (str): Data interval (e.g., '1d', '1wk', '1mo').
-            
+            interval (str): Data interval (e.g., '5m', '1h', '1d', '1wk', '1mo').
+
         Returns:
-            pd.DataFrame: Historical data with columns [Open, High, Low, Close, Volume, etc.]
+            pd.DataFrame: Historical data with columns [Date, Open, High, Low, Close, Volume, etc.]
         """
+        if interval not in DataLoader.INTERVALS:
+            print(f"Unsupported interval '{interval}'. Choose from {DataLoader.INTERVALS}")
+            return pd.DataFrame()
+
+        key = (ticker.upper(), period)
+        cached = DataLoader._cache.get(key)
+        if cached is not None and time.time() - cached[1] >= DataLoader.CACHE_TTL_SECONDS:
+            cached = None
+
+        if cached is not None:
+            cached_interval, _, cached_df, _ = cached
+            if DataLoader.can_resample(cached_interval, interval):
+                if cached_interval == interval:
+                    return cached_df.copy()
+                return DataLoader.resample_ohlcv(cached_df, interval)
+
+        # Weekly and monthly bars are always derived from daily bars
+        fetch_interval = "1d" if interval in ("1wk", "1mo") else interval
+
         try:
             stock = yf.Ticker(ticker)
-            df = stock.history(period=period, interval=interval)
+            df = stock.history(period=period, interval=fetch_interval)
             
             if df.empty:
                 raise ValueError(f"No data found for ticker symbol '{ticker}'")
                 
-            # Reset index to make Date a column
+            # Reset index to make Date a column (intraday bars are indexed by 'Datetime')
+            df.index.name = 'Date'
             df.reset_index(inplace=True)
-            return df
         except Exception as e:
             print(f"Error fetching data for {ticker}: {e}")
             return pd.DataFrame()
 
+        # Keep the finer of the cached and newly fetched series
+        if cached is None or DataLoader.can_resample(fetch_interval, cached[0]):
+            DataLoader._cache[key] = (fetch_interval, time.time(), df, {})
+
+        if fetch_interval != interval:
+            return DataLoader.resample_ohlcv(df, interval)
+        return df.copy()
+
+    @staticmethod
+    def get_artifact(ticker: str, period: str, name: str) -> Optional[Any]:
+        """Returns an object derived from a cached price series, if that series is still cached."""
+        entry = DataLoader._cache.get((ticker.upper(), period))
+        if entry is None or time.time() - entry[1] >= DataLoader.CACHE_TTL_SECONDS:
+            return None
+        return entry[3].get(name)
+
+    @staticmethod
+    def store_artifact(ticker: str, period: str, name: str, value: Any) -> bool:
+        """
+        Attaches a derived object (e.g. a stress index) to a cached price series.
+        It is dropped together with the series when that is refetched, expires or is cleared.
+        Returns False if no price series is cached for the ticker and period.
+        """
+        entry = DataLoader._cache.get((ticker.upper(), period))
+        if entry is None:
+            return False
+        entry[3][name] = value
+        return True
+
+    @staticmethod
+    def clear_cache(ticker: Optional[str] = None) -> None:
+        """Drops cached price series, for one ticker or all of them."""
+        if ticker is None:
+            DataLoader._cache.clear()
+            return
+        for key in [k for k in DataLoader._cache if k[0] == ticker.upper()]:
+            del DataLoader._cache[key]
+
     @staticmethod
     def fetch_company_info(ticker: str) -> dict:
         """